@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Any, Callable, Dict, Set
 
 from . import node, os_pkgs, python
+from .python import is_python_path
 
 ReadContent = Callable[[Dict[str, Any]], str]
 
@@ -12,6 +13,10 @@ def detect_python_required(manifest: Dict[str, Any], read_content: ReadContent)
     return python.detect_required(manifest, read_content)
 
 
+def detect_python_imports(source: str) -> Set[str]:
+    return python.detect_imports(source)
+
+
 def detect_node_required(manifest: Dict[str, Any], read_content: ReadContent) -> Set[str]:
     return node.detect_required(manifest, read_content)
 
@@ -30,6 +35,8 @@ def detect_os_packages(manifest: Dict[str, Any], read_content: ReadContent) -> D
 
 __all__ = [
     "detect_python_required",
+    "detect_python_imports",
+    "is_python_path",
     "detect_node_required",
     "extract_node_declared",
     "detect_node_installs",
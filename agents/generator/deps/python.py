@@ -14,16 +14,16 @@ def detect_required(manifest: Manifest, read_content: ReadContent) -> Set[str]:
         if not isinstance(entry, dict):
             continue
         path = (entry.get("path") or "").strip()
-        if not path or not _is_python_path(path):
+        if not path or not is_python_path(path):
             continue
         content = read_content(entry)
         if not content:
             continue
-        required.update(_detect_imports(content))
+        required.update(detect_imports(content))
     return required
 
 
-def _detect_imports(source: str) -> Set[str]:
+def detect_imports(source: str) -> Set[str]:
     packages: Set[str] = set()
     try:
         tree = ast.parse(source)
@@ -45,9 +45,9 @@ def _detect_imports(source: str) -> Set[str]:
     return packages
 
 
-def _is_python_path(path: str) -> bool:
-    lowered = path.lower()
-    return lowered.endswith(".py") or lowered.endswith(".pyw")
+def is_python_path(path: str) -> bool:
+    # Lowercase only the suffix, not the whole path.
+    return path[-4:].lower().endswith((".py", ".pyw"))
 
 
-__all__ = ["detect_required"]
+__all__ = ["detect_required", "detect_imports", "is_python_path"]
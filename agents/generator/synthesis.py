@@ -5,24 +5,29 @@ described in docs/handbook.md (스키마/아키텍처 섹션).
 """
 from __future__ import annotations
 
-import ast
-import base64
-import configparser
+import asyncio
+import binascii
 import fnmatch
+import functools
 import hashlib
 import json
+import os
 import re
 import shutil
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Sequence, Tuple
+from typing import AbstractSet, Any, Callable, Dict, List, Sequence, Set, Tuple
 
+from common import jsonio
 from common.deps.stdlib import load_stdlib_spec
 from common.logging import get_logger
-from common.prompts import build_synthesis_prompt
-from common.paths import ensure_dir
+from common.prompts import build_synthesis_prompts
+from common.paths import ensure_dir, write_bytes_atomic
 from evals.static_signatures import analyze_sql_injection_signals
 from common.rules import load_rule
 
@@ -30,8 +35,9 @@ from agents.generator.deps import (
     detect_node_installs,
     detect_node_required,
     detect_os_packages,
-    detect_python_required,
+    detect_python_imports,
     extract_node_declared,
+    is_python_path,
 )
 
 try:  # Python >=3.11
@@ -75,6 +81,14 @@ FALLBACK_POC_ENDPOINTS = {
 }
 
 
+# Module constants rather than class attributes: with slots=True the dataclass
+# field names on SynthesisLimits are slot descriptors, not the default values.
+DEFAULT_MAX_FILES = 12
+DEFAULT_MAX_BYTES_PER_FILE = 64_000
+# Upper bound on concurrent LLM calls per synthesis, however large candidate_k is.
+MAX_CANDIDATE_WORKERS = 8
+
+
 def _default_allowlist() -> List[str]:
     return [
         "Dockerfile",
@@ -91,6 +105,38 @@ def _default_allowlist() -> List[str]:
     ]
 
 
+def _has_glob_chars(pattern: str) -> bool:
+    return any(char in pattern for char in "*?[")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_allowlist(
+    patterns: Tuple[str, ...]
+) -> Tuple[frozenset[str], Tuple[str, ...], re.Pattern[str] | None]:
+    """Split allowlist patterns into literal names, "*.ext" suffixes and one glob regex.
+
+    Cached per pattern tuple so every SynthesisLimits built from the same
+    allowlist (one per requirement) reuses the translated regex.
+    """
+
+    normalized = tuple(os.path.normcase(pattern) for pattern in patterns)
+    literals = frozenset(pattern for pattern in normalized if not _has_glob_chars(pattern))
+    # fnmatch's "*" also matches "/", so "*.py" is exactly a suffix test.
+    suffixes = tuple(
+        pattern[1:]
+        for pattern in normalized
+        if pattern.startswith("*") and not _has_glob_chars(pattern[1:])
+    )
+    globs = [
+        pattern
+        for pattern in normalized
+        if pattern not in literals and not (pattern.startswith("*") and pattern[1:] in suffixes)
+    ]
+    if not globs:
+        return literals, suffixes, None
+    return literals, suffixes, re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in globs))
+
+
 PYTHON_MODULE_PACKAGE_MAP = {
     "bs4": "beautifulsoup4",
     "pil": "pillow",
@@ -109,7 +155,70 @@ PYTHON_MODULE_PACKAGE_MAP = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
+def _package_key(name: str) -> str:
+    """Lowercase/hyphenate a package name; independent of any alias map."""
+
+    normalized = name.strip()
+    if not normalized or normalized == ".":
+        return ""
+    # Most names already arrive canonical; skip the lower()/replace() copies.
+    if not (normalized.isascii() and normalized.islower() and "_" not in normalized):
+        normalized = normalized.lower().replace("_", "-")
+    # Interned names hash/compare by identity across the many guard sets.
+    return sys.intern(normalized)
+
+
+def _canonicalize_name(name: str, alias_lookup: Callable[[str], str | None]) -> str:
+    key = _package_key(name or "")
+    alias = alias_lookup(key)
+    return key if alias is None else sys.intern(alias)
+
+
+# Interpreter stdlib names, canonicalized once per process. run() replaces the
+# engine's copy with the runtime-specific spec via _load_stdlib_spec().
+_STDLIB_MODULES: frozenset[str] = frozenset(
+    canonical
+    for canonical in (
+        _canonicalize_name(name, PYTHON_MODULE_PACKAGE_MAP.get)
+        for name in getattr(sys, "stdlib_module_names", ())
+    )
+    if canonical
+)
+
+
 PIP_INSTALL_PATTERN = re.compile(r"pip(?:3)?\s+install(?P<body>[^&;|\n]*)", re.IGNORECASE)
+PIP_REQUIREMENT_FLAGS = frozenset({"-r", "--requirement"})
+PIP_EDITABLE_FLAGS = frozenset({"-e", "--editable"})
+# Leading project name of a PEP 508 requirement ("Flask[async]>=2; python_version>'3'").
+# The name must be followed by the end of the token or a specifier/extra/marker
+# delimiter, so option lines ("-r", "--hash") and bare URLs yield no name.
+DEP_TOKEN_PATTERN = re.compile(r"""\s*['"]?\s*([A-Za-z0-9][A-Za-z0-9._-]*)(?=\s*(?:$|['"\[;@<>=!~(,]))""")
+# Same name rule applied to every line of a requirements file in one pass;
+# comment, option ("-r", "--hash") and blank lines produce no match.
+REQUIREMENTS_LINE_PATTERN = re.compile(
+    r"""^[ \t]*['"]?[ \t]*([A-Za-z0-9][A-Za-z0-9._-]*)(?=[ \t]*(?:\r?$|[#'"\[;@<>=!~(,]))""",
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _dependency_token_name(token: str) -> str:
+    match = DEP_TOKEN_PATTERN.match(token)
+    return _package_key(match.group(1)) if match else ""
+
+
+def _is_requirements_file(lowered_path: str) -> bool:
+    """fnmatch("requirements*.txt") semantics without the regex machinery."""
+
+    return lowered_path.startswith("requirements") and lowered_path.endswith(".txt")
+
+
+REQUIREMENTS_CACHE_SIZE = 64
+DECODED_CACHE_SIZE = 32
+# Spellings of the interpreter constraint key in [tool.poetry.dependencies];
+# checked before falling back to a lowercase comparison.
+POETRY_PYTHON_KEYS = frozenset({"python", "Python", "PYTHON"})
 EXTERNAL_DB_PACKAGES = {
     "pymysql",
     "mysqlclient",
@@ -132,32 +241,138 @@ EXTERNAL_DB_KEYWORDS = {
 }
 
 
-@dataclass
+def _loads_outer_object(raw: str) -> Any:
+    """Parse the span from the first "{" to the last "}" of an LLM reply.
+
+    Replies are often wrapped in markdown fences or prose. The slice equals
+    the stripped reply when it is bare JSON, so either form is parsed exactly
+    once instead of failing on the whole reply before retrying the snippet.
+    """
+
+    start = raw.find("{")
+    end = raw.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        return jsonio.loads(raw[start : end + 1])
+    except jsonio.JSONDecodeError:
+        return None
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _b64decode(content: str) -> bytes:
+    """Decode base64 text without first re-encoding it to a bytes copy."""
+
+    # binascii reads ASCII str buffers in place; base64.b64decode would
+    # encode('ascii') the whole payload first. Non-ASCII input keeps the
+    # lenient bytes path (non-alphabet bytes are discarded either way).
+    if content.isascii():
+        return binascii.a2b_base64(content)
+    return binascii.a2b_base64(content.encode("utf-8"))
+
+
+def _is_base64_entry(entry: Dict[str, Any]) -> bool:
+    encoding = entry.get("encoding")
+    # Common case is absent/"plain"; only lowercase unusual spellings.
+    if encoding is None or encoding == "plain":
+        return False
+    return encoding == "base64" or (isinstance(encoding, str) and encoding.lower() == "base64")
+
+
+def _utf8_length(text: str) -> int:
+    """Return the UTF-8 byte length of ``text``, skipping the encode for ASCII."""
+
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8"))
+
+
+def _is_complete_poc(value: Any) -> bool:
+    return isinstance(value, dict) and "cmd" in value and "success_signature" in value
+
+
+def _is_str_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _is_nonempty_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value)
+
+
+# Shape-only checks for top-level manifest sections, built once at import.
+# Policy checks (allowlist, byte limits, dependency guard) stay in the engine.
+MANIFEST_SECTION_CHECKS: Tuple[Tuple[str, Callable[[Any], bool], str], ...] = (
+    ("poc", _is_complete_poc, "poc section incomplete"),
+    ("deps", _is_str_list, "deps must be an array of strings"),
+    ("pattern_tags", _is_nonempty_list, "pattern_tags required"),
+)
+
+
+def _manifest_shape_errors(manifest: Dict[str, Any]) -> List[str]:
+    return [message for key, check, message in MANIFEST_SECTION_CHECKS if not check(manifest.get(key))]
+
+
+@dataclass(slots=True)
 class DeclaredDependencies:
     combined: set[str]
     from_deps_field: set[str]
     from_requirements: set[str]
+    # Keyed by _normalize_requirements_path(path); lookups normalize the same way.
     requirements_by_path: Dict[str, set[str]]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
+class ManifestScan:
+    """Single pass over manifest files: path/size errors plus dependency sets."""
+
+    errors: List[str]
+    declared: DeclaredDependencies
+    required: set[str]
+
+
+@dataclass(frozen=True, slots=True)
 class SynthesisLimits:
     """Constraints mirrored in docs/handbook.md (generator_manifest)."""
 
-    max_files: int = 12
-    max_bytes_per_file: int = 64_000
+    max_files: int = DEFAULT_MAX_FILES
+    max_bytes_per_file: int = DEFAULT_MAX_BYTES_PER_FILE
     allowlist: Sequence[str] = field(default_factory=_default_allowlist)
+    _literal_names: frozenset[str] = field(init=False, repr=False, compare=False)
+    _suffixes: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _glob_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Most allowlist entries are literal filenames or "*.ext" globs; match
+        # those with a set lookup and one tuple endswith, and only fall back to
+        # the compiled glob regex for the remaining patterns.
+        literals, suffixes, glob_re = _compile_allowlist(tuple(self.allowlist))
+        object.__setattr__(self, "_literal_names", literals)
+        object.__setattr__(self, "_suffixes", suffixes)
+        object.__setattr__(self, "_glob_re", glob_re)
 
     @classmethod
     def from_requirement(cls, requirement: Dict[str, Any]) -> "SynthesisLimits":
         provided = requirement.get("synthesis_limits") or {}
         allowlist = provided.get("allowlist") or _default_allowlist()
         return cls(
-            max_files=int(provided.get("max_files", cls.max_files)),
-            max_bytes_per_file=int(provided.get("max_bytes_per_file", cls.max_bytes_per_file)),
+            max_files=int(provided.get("max_files", DEFAULT_MAX_FILES)),
+            max_bytes_per_file=int(provided.get("max_bytes_per_file", DEFAULT_MAX_BYTES_PER_FILE)),
             allowlist=tuple(allowlist),
         )
 
+    def allows(self, path: str) -> bool:
+        name = os.path.normcase(path)
+        if name in self._literal_names or name.endswith(self._suffixes):
+            return True
+        return self._glob_re is not None and self._glob_re.match(name) is not None
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "max_files": self.max_files,
@@ -166,7 +381,7 @@ class SynthesisLimits:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateReport:
     """Aggregated info per synthesis trial."""
 
@@ -177,11 +392,18 @@ class CandidateReport:
     score: float
     static_report: Dict[str, Any]
     guard_report: Dict[str, Any] | None = None
+    _digest: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def manifest_digest(self) -> str:
-        serialized = json.dumps(self.manifest, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        # The manifest is final once the report exists, but to_summary() runs
+        # for every candidate log write; hash the canonical JSON only once.
+        # Digests cover compact key-sorted bytes (jsonio.dumps_canonical);
+        # logs written before that change hashed ", "/": "-separated JSON, so
+        # their manifest_digest values are not comparable with these.
+        if self._digest is None:
+            self._digest = hashlib.sha256(jsonio.dumps_canonical(self.manifest)).hexdigest()
+        return self._digest
 
     def to_summary(self) -> Dict[str, Any]:
         files = self.manifest.get("files") or []
@@ -200,7 +422,7 @@ class CandidateReport:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SynthesisOutcome:
     """Return payload after the engine finishes."""
 
@@ -234,15 +456,18 @@ class SynthesisEngine:
         self.metadata_dir = ensure_dir(metadata_dir)
         self.mode = mode
         self._user_deps = [dep.strip() for dep in (user_deps or []) if isinstance(dep, str) and dep.strip()]
+        # Lowered once here; every candidate manifest is deduplicated against them.
+        self._user_dep_keys = [(dep, dep.lower()) for dep in self._user_deps]
         ensure_dir(self.workspace.parent)
         self._dep_guard_config: Dict[str, Any] = {}
-        base_stdlib = getattr(sys, "stdlib_module_names", None) or set()
-        self._stdlib_modules = {
-            self._canonicalize_package_name(name)
-            for name in base_stdlib
-            if self._canonicalize_package_name(name)
-        }
+        self._stdlib_modules: AbstractSet[str] = _STDLIB_MODULES
         self._module_alias_map = dict(PYTHON_MODULE_PACKAGE_MAP)
+        # Bound once; _load_stdlib_spec rebinds after replacing the map.
+        self._alias_lookup = self._module_alias_map.get
+        self._requirements_cache: OrderedDict[str, frozenset[str]] = OrderedDict()
+        self._decoded_cache: OrderedDict[str, str] = OrderedDict()
+        # Candidates may be guarded on worker threads (_evaluate_candidates).
+        self._cache_lock = threading.Lock()
         self._default_versions = {
             "requests": "2.32.2",
             "pysqlite3-binary": "0.5.2",
@@ -264,7 +489,6 @@ class SynthesisEngine:
         """Generate k candidates, select the best, and materialize it."""
 
         candidate_k = max(1, int(candidate_k or 1))
-        reports: List[CandidateReport] = []
         self._requirement = requirement
         self._load_stdlib_spec()
         self._dep_guard_config = requirement.get("dep_guard") or {}
@@ -272,51 +496,17 @@ class SynthesisEngine:
         self._rule = load_rule(requirement.get("vuln_id"))
         poc_template = self._normalize_poc_template(poc_template)
 
-        for idx in range(1, candidate_k + 1):
-            messages = build_synthesis_prompt(
-                requirement,
-                rag_context,
-                hints=hints,
-                failure_context=failure_context,
-                limits=self.limits.to_dict(),
-                candidate_index=idx,
-                poc_template=poc_template,
-            )
-            raw = self.llm.generate(messages)
-            manifest = self._parse_manifest(raw, idx)
-            manifest = self._apply_poc_template(manifest, poc_template)
-            manifest = self._ensure_fallback_poc(manifest, poc_template)
-            manifest = self._inject_user_deps(manifest)
-            declared = self._extract_declared_dependencies(manifest)
-            required_static = self._detect_required_dependencies(manifest)
-            llm_section = None
-            if self._dep_guard_config.get("llm_assist") or self._auto_patch_enabled:
-                llm_section = self._llm_infer_dependencies(manifest, required_static, declared)
-            auto_patch_info = (
-                self._maybe_auto_patch_dependencies(manifest, declared, required_static, llm_section)
-                if self._auto_patch_enabled
-                else {"enabled": False}
-            )
-            if auto_patch_info.get("patched") or auto_patch_info.get("synced_requirements"):
-                declared = self._extract_declared_dependencies(manifest)
-            violations, guard_report = self._guard_manifest(
-                manifest,
-                precomputed_llm=llm_section,
-                auto_patch=auto_patch_info,
-            )
-            static_report = self._analyze_static_signals(manifest)
-            score = self._score_candidate(len(violations), static_report.get("score", 0.0))
-            reports.append(
-                CandidateReport(
-                    index=idx,
-                    manifest=manifest,
-                    raw_response=raw,
-                    violations=violations,
-                    score=score,
-                    static_report=static_report,
-                    guard_report=guard_report,
-                )
-            )
+        messages_list = build_synthesis_prompts(
+            requirement,
+            rag_context,
+            candidate_count=candidate_k,
+            hints=hints,
+            failure_context=failure_context,
+            limits=self.limits.to_dict(),
+            poc_template=poc_template,
+        )
+        raw_responses = self._generate_candidates(messages_list)
+        reports = self._evaluate_candidates(raw_responses, poc_template)
 
         self._write_candidate_log(reports)
         accepted = [report for report in reports if not report.violations]
@@ -347,6 +537,89 @@ class SynthesisEngine:
         return SynthesisOutcome(selected=selected, written_files=written, reports=reports)
 
     # --- internal helpers -------------------------------------------------
+    def _generate_candidates(self, messages_list: List[List[Dict[str, str]]]) -> List[str]:
+        """Request every candidate concurrently; LLM calls are I/O bound."""
+
+        if len(messages_list) <= 1:
+            return [self.llm.generate(messages) for messages in messages_list]
+        # Clients with an async API share one event loop; asyncio.run cannot
+        # nest, so callers already inside a loop use the thread pool instead.
+        if hasattr(self.llm, "agenerate") and not _event_loop_running():
+            return asyncio.run(self._agenerate_candidates(messages_list))
+        with ThreadPoolExecutor(max_workers=min(MAX_CANDIDATE_WORKERS, len(messages_list))) as executor:
+            return list(executor.map(self.llm.generate, messages_list))
+
+    async def _agenerate_candidates(self, messages_list: List[List[Dict[str, str]]]) -> List[str]:
+        limit = asyncio.Semaphore(MAX_CANDIDATE_WORKERS)
+
+        async def generate(messages: List[Dict[str, str]]) -> str:
+            async with limit:
+                return await self.llm.agenerate(messages)
+
+        return list(await asyncio.gather(*(generate(messages) for messages in messages_list)))
+
+    def _evaluate_candidates(
+        self, raw_responses: List[str], poc_template: Dict[str, Any]
+    ) -> List[CandidateReport]:
+        """Guard every candidate, concurrently when the guard itself calls the LLM."""
+
+        def evaluate(job: Tuple[int, str]) -> CandidateReport:
+            return self._evaluate_candidate(job[0], job[1], poc_template)
+
+        jobs = list(enumerate(raw_responses, start=1))
+        # Without dependency inference the pipeline is pure CPU work under the
+        # GIL, so threads would only add overhead.
+        if len(jobs) <= 1 or not self._uses_llm_dep_inference():
+            return [evaluate(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=min(MAX_CANDIDATE_WORKERS, len(jobs))) as executor:
+            return list(executor.map(evaluate, jobs))
+
+    def _evaluate_candidate(self, idx: int, raw: str, poc_template: Dict[str, Any]) -> CandidateReport:
+        manifest = self._parse_manifest(raw, idx)
+        manifest = self._apply_poc_template(manifest, poc_template)
+        manifest = self._ensure_fallback_poc(manifest, poc_template)
+        manifest = self._inject_user_deps(manifest)
+        scan = self._scan_files(manifest)
+        scanned_file_count = len(manifest.get("files") or [])
+        declared = scan.declared
+        required_static = scan.required
+        llm_section = None
+        if self._uses_llm_dep_inference():
+            llm_section = self._llm_infer_dependencies(manifest, required_static, declared)
+        auto_patch_info = (
+            self._maybe_auto_patch_dependencies(manifest, declared, required_static, llm_section)
+            if self._auto_patch_enabled
+            else {"enabled": False}
+        )
+        # Reuse the scan for the guard unless auto-patch edited requirements/deps
+        # in place or appended a requirements.txt entry.
+        if (
+            auto_patch_info.get("patched")
+            or auto_patch_info.get("synced_requirements")
+            or len(manifest.get("files") or []) != scanned_file_count
+        ):
+            scan = self._scan_files(manifest)
+        violations, guard_report = self._guard_manifest(
+            manifest,
+            precomputed_llm=llm_section,
+            auto_patch=auto_patch_info,
+            scan=scan,
+        )
+        static_report = self._analyze_static_signals(manifest)
+        score = self._score_candidate(len(violations), static_report.get("score", 0.0))
+        return CandidateReport(
+            index=idx,
+            manifest=manifest,
+            raw_response=raw,
+            violations=violations,
+            score=score,
+            static_report=static_report,
+            guard_report=guard_report,
+        )
+
+    def _uses_llm_dep_inference(self) -> bool:
+        return bool(self._dep_guard_config.get("llm_assist") or self._auto_patch_enabled)
+
     @staticmethod
     def _score_candidate(violation_count: int, signal_score: float) -> float:
         base = max(0.0, 1.0 - 0.2 * violation_count)
@@ -387,10 +660,13 @@ class SynthesisEngine:
             or "3.11"
         )
         spec = load_stdlib_spec(language=language, version=str(version))
-        self._stdlib_modules = {self._canonicalize_package_name(name) for name in spec.stdlib_modules}
+        self._stdlib_modules = frozenset(self._canonicalize_package_name(name) for name in spec.stdlib_modules)
         # Merge aliases/defaults with fallbacks to preserve canonical names.
         self._module_alias_map = dict(PYTHON_MODULE_PACKAGE_MAP)
         self._module_alias_map.update({k.lower(): v for k, v in spec.aliases.items()})
+        self._alias_lookup = self._module_alias_map.get
+        # Cached package sets were canonicalized with the previous aliases.
+        self._requirements_cache.clear()
         self._default_versions = {
             "requests": "2.32.2",
             "pysqlite3-binary": "0.5.2",
@@ -431,21 +707,9 @@ class SynthesisEngine:
         return manifest
 
     def _parse_manifest(self, raw: str, idx: int) -> Dict[str, Any]:
-        try:
-            manifest = json.loads(raw)
-            if isinstance(manifest, dict):
-                return manifest
-        except json.JSONDecodeError:
-            start = raw.find("{")
-            end = raw.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                snippet = raw[start : end + 1]
-                try:
-                    manifest = json.loads(snippet)
-                    if isinstance(manifest, dict):
-                        return manifest
-                except json.JSONDecodeError:
-                    pass
+        manifest = _loads_outer_object(raw)
+        if isinstance(manifest, dict):
+            return manifest
         LOGGER.warning("Candidate %s emitted non-JSON manifest; using fallback.", idx)
         return self._fallback_manifest()
 
@@ -552,6 +816,7 @@ class SynthesisEngine:
         *,
         precomputed_llm: Dict[str, Any] | None = None,
         auto_patch: Dict[str, Any] | None = None,
+        scan: ManifestScan | None = None,
     ) -> Tuple[List[str], Dict[str, Any]]:
         errors: List[str] = []
         dep_error_messages: List[str] = []
@@ -565,26 +830,15 @@ class SynthesisEngine:
         if len(files) > self.limits.max_files:
             errors.append(f"files exceeds limit ({len(files)}/{self.limits.max_files})")
 
-        allowlist = tuple(self.limits.allowlist)
-        for entry in files:
-            if not isinstance(entry, dict):
-                errors.append("file entry must be object")
-                continue
-            path = entry.get("path", "")
-            content = entry.get("content", "")
-            if not path or Path(path).is_absolute() or ".." in Path(path).parts:
-                errors.append(f"invalid path: {path}")
-                continue
-            if allowlist and not self._path_in_allowlist(path, allowlist):
-                errors.append(f"path '{path}' not in allowlist")
-            byte_len = len(content.encode("utf-8"))
-            if byte_len > self.limits.max_bytes_per_file:
-                errors.append(f"{path} exceeds byte limit ({byte_len})")
+        if scan is None:
+            scan = self._scan_files(manifest)
+        errors.extend(scan.errors)
 
-        poc = manifest.get("poc", {})
-        if not isinstance(poc, dict) or "cmd" not in poc or "success_signature" not in poc:
-            errors.append("poc section incomplete")
-        else:
+        # Violations keep the historical order: poc (shape or signature/flag),
+        # then deps, then pattern_tags. The poc shape error and the signature
+        # checks are exclusive, so the table's poc entry lands in the same slot.
+        poc = manifest.get("poc")
+        if _is_complete_poc(poc):
             signature = poc.get("success_signature", "")
             vuln = str((self._requirement or {}).get("vuln_id") or "").strip().lower()
             rule_sig = (self._rule or {}).get("success_signature") if hasattr(self, "_rule") else None
@@ -599,17 +853,10 @@ class SynthesisEngine:
             if strict_flag and expected_flag:
                 if not self._manifest_contains_literal(manifest, expected_flag):
                     errors.append(f"flag token '{expected_flag}' missing from manifest")
+        errors.extend(_manifest_shape_errors(manifest))
 
-        deps = manifest.get("deps")
-        if deps is None or not isinstance(deps, list) or not all(isinstance(d, str) for d in deps):
-            errors.append("deps must be an array of strings")
-
-        pattern_tags = manifest.get("pattern_tags")
-        if not isinstance(pattern_tags, list) or not pattern_tags:
-            errors.append("pattern_tags required")
-
-        declared = self._extract_declared_dependencies(manifest)
-        required_deps = self._detect_required_dependencies(manifest)
+        declared = scan.declared
+        required_deps = scan.required
         missing_static = sorted(required_deps - declared.combined)
         for dep in missing_static:
             msg = f"missing dependency '{dep}' required by manifest files"
@@ -711,39 +958,116 @@ class SynthesisEngine:
         return errors, dep_guard
 
     def _materialize(self, manifest: Dict[str, Any]) -> List[str]:
-        if self.workspace.exists():
-            shutil.rmtree(self.workspace)
+        """Sync the workspace to the manifest, leaving byte-identical files untouched.
+
+        Unchanged files keep their mtimes so downstream Docker layer caches stay
+        valid; files that are no longer part of the manifest are removed.
+        """
+
         ensure_dir(self.workspace)
+        stale = {path for path in self.workspace.rglob("*") if path.is_file() or path.is_symlink()}
         written: List[str] = []
+        unchanged = 0
+        verified_dirs: Set[Path] = {self.workspace}
         for entry in manifest.get("files", []):
             if not isinstance(entry, dict):
                 continue
-            rel_path = Path(entry.get("path", ""))
-            if not rel_path or rel_path.is_absolute():
+            # Check the raw string first: Path("") is Path(".") and truthy.
+            raw_path = entry.get("path")
+            if not isinstance(raw_path, str) or not raw_path.strip():
+                continue
+            rel_path = Path(raw_path)
+            if rel_path.is_absolute():
                 continue
             destination = self.workspace / rel_path
-            ensure_dir(destination.parent)
-            content = entry.get("content", "")
-            encoding = entry.get("encoding", "plain")
-            if encoding == "base64":
-                try:
-                    decoded = base64.b64decode(content.encode("utf-8"))
-                    destination.write_bytes(decoded)
-                except Exception as exc:  # pragma: no cover - safety fallback
-                    LOGGER.warning("Base64 decode failed for %s: %s", rel_path, exc)
-                    destination.write_text(content, encoding="utf-8")
+            payload = self._entry_payload(entry, rel_path)
+            stale.discard(destination)
+            self._clear_destination(destination, verified_dirs)
+            if self._file_matches(destination, payload):
+                unchanged += 1
             else:
-                destination.write_text(content, encoding="utf-8")
+                destination.write_bytes(payload)
             written.append(str(rel_path))
+        removed = 0
+        for path in stale:
+            # A write above may have replaced this path, or one of its parents,
+            # with a directory or a file; lstat-based checks skip those.
+            if path.is_symlink() or path.is_file():
+                path.unlink()
+                removed += 1
+        self._prune_empty_dirs()
+        LOGGER.debug(
+            "Materialized %s files for %s (%s unchanged, %s removed)",
+            len(written),
+            self.sid,
+            unchanged,
+            removed,
+        )
         return written
 
+    def _clear_destination(self, destination: Path, verified_dirs: Set[Path]) -> None:
+        """Remove anything left from earlier runs that would block writing ``destination``.
+
+        Symlinks are unlinked rather than written through (they could point
+        outside the workspace), stale files standing where a parent directory
+        must go are removed, and a directory standing where the file goes is
+        deleted. ``verified_dirs`` caches parents already made real directories.
+        """
+
+        parent = destination.parent
+        if parent not in verified_dirs:
+            current = self.workspace
+            for part in parent.relative_to(self.workspace).parts:
+                current = current / part
+                if current in verified_dirs:
+                    continue
+                if current.is_symlink() or (current.exists() and not current.is_dir()):
+                    current.unlink()
+                verified_dirs.add(current)
+            ensure_dir(parent)
+        if destination.is_symlink():
+            destination.unlink()
+        elif destination.is_dir():
+            shutil.rmtree(destination)
+            verified_dirs.difference_update(
+                [path for path in verified_dirs if path == destination or destination in path.parents]
+            )
+
+    @staticmethod
+    def _entry_payload(entry: Dict[str, Any], rel_path: Path) -> bytes:
+        content = entry.get("content", "")
+        if _is_base64_entry(entry):
+            try:
+                return _b64decode(content)
+            except Exception as exc:  # pragma: no cover - safety fallback
+                LOGGER.warning("Base64 decode failed for %s: %s", rel_path, exc)
+        return content.encode("utf-8")
+
+    @staticmethod
+    def _file_matches(destination: Path, payload: bytes) -> bool:
+        if destination.is_symlink() or not destination.is_file():
+            return False
+        if destination.stat().st_size != len(payload):
+            return False
+        return destination.read_bytes() == payload
+
+    def _prune_empty_dirs(self) -> None:
+        directories = sorted(
+            (path for path in self.workspace.rglob("*") if path.is_dir() and not path.is_symlink()),
+            key=lambda path: len(path.parts),
+            reverse=True,
+        )
+        for directory in directories:
+            if not any(directory.iterdir()):
+                directory.rmdir()
+
     def _write_candidate_log(self, reports: List[CandidateReport]) -> None:
         candidates_path = self.metadata_dir / "generator_candidates.json"
         payload = {
             "mode": self.mode,
             "candidates": [report.to_summary() for report in reports],
         }
-        candidates_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        write_bytes_atomic(candidates_path, jsonio.dumps_bytes(payload, indent=True))
 
     def _write_records(
         self,
@@ -770,7 +1094,7 @@ class SynthesisEngine:
             "user_deps": self._user_deps,
             "requires_external_db": requires_external_db,
         }
-        manifest_path.write_text(json.dumps(manifest_payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        write_bytes_atomic(manifest_path, jsonio.dumps_bytes(manifest_payload, indent=True))
         self._write_candidate_log(reports)
 
     def _record_guard_failure(self, reports: List[CandidateReport]) -> None:
@@ -812,8 +1136,8 @@ class SynthesisEngine:
             "notes": guard_notes,
             "auto_patch": auto_patch_entries[-1] if auto_patch_entries else {},
         }
-        with failure_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        with failure_path.open("ab") as handle:
+            handle.write(jsonio.dumps_bytes(entry) + b"\n")
 
     def _detect_node_required(self, manifest: Dict[str, Any]) -> set[str]:
         return {
@@ -822,11 +1146,12 @@ class SynthesisEngine:
         }
 
     def _extract_node_declared_sets(self, manifest: Dict[str, Any]) -> set[str]:
-        return {
+        declared = {
             self._canonicalize_package_name(name)
             for name in extract_node_declared(manifest, self._read_text_content)
-            if self._canonicalize_package_name(name)
         }
+        declared.discard("")
+        return declared
 
     def _detect_node_installs(self, manifest: Dict[str, Any]) -> set[str]:
         dockerfile_entry = self._find_file_entry(manifest, "Dockerfile")
@@ -870,11 +1195,8 @@ class SynthesisEngine:
         if not isinstance(deps_list, list):
             deps_list = []
             manifest["deps"] = deps_list
-        declared_deps = {
-            self._canonicalize_package_name(self._strip_version(dep.split(" ", 1)[0]))
-            for dep in deps_list
-            if isinstance(dep, str)
-        }
+        declared_deps = {self._normalize_dependency_token(dep) for dep in deps_list}
+        declared_deps.discard("")
         requirements_packages = self._extract_packages_from_requirements(requirements_entry.get("content", ""))
         missing_requirements = declared_deps - requirements_packages
         for canonical in sorted(missing_requirements):
@@ -883,7 +1205,7 @@ class SynthesisEngine:
             version = self._default_versions.get(canonical)
             name = canonical
             if version:
-                self._append_requirement_line(requirements_entry, name, version)
+                self._append_requirement_line(requirements_entry, name, version, requirements_packages)
                 info["synced_requirements"].append({"name": name, "version": version})
             else:
                 info["synced_requirements"].append({"name": name, "reason": "no default version"})
@@ -910,7 +1232,7 @@ class SynthesisEngine:
                 continue
             spec = f"{target_name}=={version}"
             deps_list.append(spec)
-            self._append_requirement_line(requirements_entry, target_name, version)
+            self._append_requirement_line(requirements_entry, target_name, version, requirements_packages)
             patched_canonicals.add(target_canonical)
             info["patched"].append(
                 {
@@ -928,7 +1250,7 @@ class SynthesisEngine:
             if not isinstance(entry, dict):
                 continue
             path = (entry.get("path") or "").lower()
-            if fnmatch.fnmatch(path, "requirements*.txt"):
+            if _is_requirements_file(path):
                 entry.setdefault("content", "")
                 if not entry.get("description"):
                     entry["description"] = "Pinned deps for SBOM."
@@ -941,18 +1263,27 @@ class SynthesisEngine:
         files.append(entry)
         return entry
 
-    def _append_requirement_line(self, entry: Dict[str, Any], package: str, version: str) -> None:
+    def _append_requirement_line(
+        self,
+        entry: Dict[str, Any],
+        package: str,
+        version: str,
+        existing: set[str] | None = None,
+    ) -> None:
+        """Append ``package`` unless already listed.
+
+        Callers appending several lines pass ``existing`` (the packages already
+        in ``entry``); it is updated in place so the growing content is not
+        reparsed for every appended line.
+        """
+
         content = entry.get("content") or ""
-        existing = {
-            self._canonicalize_package_name(
-                self._strip_version(line.split("#", 1)[0].strip())
-            )
-            for line in content.splitlines()
-            if line.strip()
-        }
+        if existing is None:
+            existing = self._parse_requirements_content(content)
         canonical = self._canonicalize_package_name(package)
         if canonical in existing:
             return
+        existing.add(canonical)
         line = f"{package}=={version}" if version else package
         if content and not content.endswith("\n"):
             content += "\n"
@@ -960,25 +1291,21 @@ class SynthesisEngine:
         entry["content"] = content
 
     def _extract_packages_from_requirements(self, content: str) -> set[str]:
-        packages: set[str] = set()
         if not isinstance(content, str):
-            return packages
-        for raw_line in content.splitlines():
-            token = raw_line.split("#", 1)[0].strip()
-            if not token:
-                continue
-            canonical = self._canonicalize_package_name(self._strip_version(token))
-            if canonical:
-                packages.add(canonical)
-        return packages
+            return set()
+        return self._parse_requirements_content(content)
 
     def _is_stdlib_module(self, name: str) -> bool:
         return self._canonicalize_package_name(name) in self._stdlib_modules
-    def _extract_declared_dependencies(self, manifest: Dict[str, Any]) -> DeclaredDependencies:
+    def _scan_files(self, manifest: Dict[str, Any]) -> ManifestScan:
+        """Walk manifest files once, reading each entry's content a single time."""
+
+        errors: List[str] = []
         combined: set[str] = set()
         from_deps_field: set[str] = set()
         from_requirements: set[str] = set()
         requirements_by_path: Dict[str, set[str]] = {}
+        required: set[str] = set()
 
         deps = manifest.get("deps") or []
         if isinstance(deps, list):
@@ -993,7 +1320,9 @@ class SynthesisEngine:
 
         for entry in manifest.get("files", []):
             if not isinstance(entry, dict):
+                errors.append("file entry must be object")
                 continue
+            errors.extend(self._file_entry_errors(entry))
             path = (entry.get("path") or "").strip()
             if not path:
                 continue
@@ -1001,23 +1330,20 @@ class SynthesisEngine:
             content = self._read_text_content(entry)
             if not content:
                 continue
-            if fnmatch.fnmatch(lowered, "requirements*.txt"):
+            if _is_requirements_file(lowered):
                 packages = self._parse_requirements_content(content)
-                requirements_by_path[path] = packages
-                normalized_path = self._normalize_requirements_path(path)
-                requirements_by_path.setdefault(normalized_path, packages)
-                requirements_by_path.setdefault(f"./{normalized_path}", packages)
-                for pkg in packages:
-                    combined.add(pkg)
-                    from_requirements.add(pkg)
+                requirements_by_path.setdefault(self._normalize_requirements_path(path), packages)
+                combined.update(packages)
+                from_requirements.update(packages)
             elif lowered == "pyproject.toml" and tomllib:
                 try:
                     data = tomllib.loads(content)
                 except (tomllib.TOMLDecodeError, AttributeError):  # pragma: no cover - parse guard
-                    continue
-                for pkg in self._extract_pyproject_dependencies(data):
-                    combined.add(pkg)
+                    data = {}
+                combined.update(self._extract_pyproject_dependencies(data))
             elif lowered == "setup.cfg":
+                import configparser  # deferred: setup.cfg manifests are rare
+
                 parser = configparser.ConfigParser()
                 try:
                     parser.read_string(content)
@@ -1025,22 +1351,38 @@ class SynthesisEngine:
                     continue
                 install_requires = parser.get("options", "install_requires", fallback="")
                 if install_requires:
-                    packages = self._parse_requirements_content(install_requires)
-                    for pkg in packages:
-                        combined.add(pkg)
+                    combined.update(self._parse_requirements_content(install_requires))
+            elif is_python_path(path):
+                required.update(
+                    self._canonicalize_package_name(name) for name in detect_python_imports(content)
+                )
 
-        return DeclaredDependencies(
+        declared = DeclaredDependencies(
             combined=combined,
             from_deps_field=from_deps_field,
             from_requirements=from_requirements,
             requirements_by_path=requirements_by_path,
         )
-
-    def _detect_required_dependencies(self, manifest: Dict[str, Any]) -> set[str]:
-        return {
-            self._canonicalize_package_name(name)
-            for name in detect_python_required(manifest, self._read_text_content)
-        }
+        return ManifestScan(errors=errors, declared=declared, required=required)
+
+    def _file_entry_errors(self, entry: Dict[str, Any]) -> List[str]:
+        path = entry.get("path", "")
+        if not path:
+            return [f"invalid path: {path}"]
+        parsed = Path(path)
+        if parsed.is_absolute() or ".." in parsed.parts:
+            return [f"invalid path: {path}"]
+        errors: List[str] = []
+        if self.limits.allowlist and not self.limits.allows(path):
+            errors.append(f"path '{path}' not in allowlist")
+        content = entry.get("content", "")
+        limit = self.limits.max_bytes_per_file
+        # UTF-8 uses at most 4 bytes per code point, so short content can skip the count.
+        if len(content) * 4 > limit:
+            byte_len = _utf8_length(content)
+            if byte_len > limit:
+                errors.append(f"{path} exceeds byte limit ({byte_len})")
+        return errors
 
     def _llm_infer_dependencies(
         self,
@@ -1086,10 +1428,9 @@ class SynthesisEngine:
         if rule_value is not None:
             return bool(rule_value)
         deps = manifest.get("deps") or []
-        for dep in deps:
-            dep_lower = str(dep).lower()
-            if any(package in dep_lower for package in EXTERNAL_DB_PACKAGES):
-                return True
+        # EXTERNAL_DB_PACKAGES holds canonical names; isdisjoint stops at the first hit.
+        if not EXTERNAL_DB_PACKAGES.isdisjoint(self._normalize_dependency_token(dep) for dep in deps):
+            return True
         files = manifest.get("files") or []
         for entry in files:
             content = entry.get("content")
@@ -1258,8 +1599,10 @@ class SynthesisEngine:
             if not isinstance(entry, dict):
                 continue
             path = (entry.get("path") or "").strip()
+            if not path:
+                continue
             content = self._read_text_content(entry)
-            if not path or not content:
+            if not content:
                 continue
             snippets.append(
                 {
@@ -1276,18 +1619,7 @@ class SynthesisEngine:
         return suffix or "text"
 
     def _parse_json_response(self, raw: str) -> Any:
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
-            start = raw.find("{")
-            end = raw.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                snippet = raw[start : end + 1]
-                try:
-                    return json.loads(snippet)
-                except json.JSONDecodeError:
-                    return None
-        return None
+        return _loads_outer_object(raw)
 
     def _normalize_llm_suggestions(self, python_section: Dict[str, Any]) -> List[Dict[str, Any]]:
         suggestions: List[Dict[str, Any]] = []
@@ -1358,151 +1690,123 @@ class SynthesisEngine:
 
     def _parse_pip_install_body(self, body: str, requirements_by_path: Dict[str, set[str]]) -> set[str]:
         packages: set[str] = set()
-        tokens = body.strip().split()
-        idx = 0
-        while idx < len(tokens):
-            token = tokens[idx].strip().strip("'\"")
-            lowered = token.lower()
+        tokens = iter(body.split())
+        for raw_token in tokens:
+            token = raw_token.strip("'\"")
             if not token:
-                idx += 1
                 continue
-            if lowered in {"-r", "--requirement"}:
-                idx += 1
-                if idx < len(tokens):
-                    packages.update(self._packages_from_requirements_path(tokens[idx], requirements_by_path))
-                idx += 1
+            if token[0] != "-":
+                canonical = self._normalize_dependency_token(token)
+                if canonical:
+                    packages.add(canonical)
                 continue
-            if lowered.startswith("-r") and lowered not in {"-r"}:
-                packages.update(self._packages_from_requirements_path(token[2:], requirements_by_path))
-                idx += 1
-                continue
-            if lowered.startswith("--requirement="):
+            lowered = token.lower()
+            if lowered in PIP_REQUIREMENT_FLAGS:
+                target = next(tokens, None)
+                if target is not None:
+                    packages.update(
+                        self._packages_from_requirements_path(target.strip("'\""), requirements_by_path)
+                    )
+            elif lowered.startswith("--requirement="):
                 packages.update(
                     self._packages_from_requirements_path(token.split("=", 1)[1], requirements_by_path)
                 )
-                idx += 1
-                continue
-            if lowered in {"-e", "--editable"}:
-                idx += 2  # skip editable target
-                continue
-            if lowered.startswith("-"):
-                idx += 1
-                continue
-            canonical = self._normalize_dependency_token(token)
-            if canonical and canonical != ".":
-                packages.add(canonical)
-            idx += 1
+            elif lowered.startswith("-r"):
+                packages.update(self._packages_from_requirements_path(token[2:], requirements_by_path))
+            elif lowered in PIP_EDITABLE_FLAGS:
+                next(tokens, None)  # skip editable target
         return packages
 
     def _packages_from_requirements_path(
         self, path: str, requirements_by_path: Dict[str, set[str]]
     ) -> set[str]:
-        normalized = self._normalize_requirements_path(path)
-        return (
-            requirements_by_path.get(path)
-            or requirements_by_path.get(normalized)
-            or requirements_by_path.get(f"./{normalized}")
-            or set()
-        )
+        return requirements_by_path.get(self._normalize_requirements_path(path)) or set()
 
     def _extract_pyproject_dependencies(self, data: Dict[str, Any]) -> set[str]:
+        normalize = self._normalize_dependency_token
         packages: set[str] = set()
         project = data.get("project")
         if isinstance(project, dict):
-            for dep in project.get("dependencies", []) or []:
-                if isinstance(dep, str):
-                    canonical = self._normalize_dependency_token(dep)
-                    if canonical:
-                        packages.add(canonical)
+            packages.update(map(normalize, project.get("dependencies", []) or []))
             optional = project.get("optional-dependencies", {})
             if isinstance(optional, dict):
-                for deps in optional.values():
-                    for dep in deps or []:
-                        if isinstance(dep, str):
-                            canonical = self._normalize_dependency_token(dep)
-                            if canonical:
-                                packages.add(canonical)
+                packages.update(normalize(dep) for deps in optional.values() for dep in deps or [])
         tool = data.get("tool")
         if isinstance(tool, dict):
             poetry = tool.get("poetry")
             if isinstance(poetry, dict):
                 deps = poetry.get("dependencies", {})
                 if isinstance(deps, dict):
-                    for name, constraint in deps.items():
-                        if name.lower() == "python":
-                            continue
-                        canonical = self._normalize_dependency_token(name)
-                        if canonical:
-                            packages.add(canonical)
+                    packages.update(
+                        normalize(name)
+                        for name in deps
+                        if not (name in POETRY_PYTHON_KEYS or name.lower() == "python")
+                    )
                 extras = poetry.get("extras", {})
                 if isinstance(extras, dict):
-                    for deps in extras.values():
-                        for dep in deps or []:
-                            canonical = self._normalize_dependency_token(dep)
-                            if canonical:
-                                packages.add(canonical)
+                    packages.update(normalize(dep) for deps in extras.values() for dep in deps or [])
+        # _normalize_dependency_token yields "" for non-strings and unnamed tokens.
+        packages.discard("")
         return packages
 
     def _parse_requirements_content(self, content: str) -> set[str]:
-        packages: set[str] = set()
-        for raw_line in content.splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            token = line.split("#", 1)[0].strip()
-            canonical = self._normalize_dependency_token(token)
-            if canonical:
-                packages.add(canonical)
+        # The same requirements text is rescanned by the guard, the auto-patch
+        # pass and the post-patch dependency refresh; keying on the str itself
+        # reuses its cached hash, so hits cost no extra pass over the content.
+        with self._cache_lock:
+            cached = self._requirements_cache.get(content)
+            if cached is not None:
+                self._requirements_cache.move_to_end(content)
+        if cached is not None:
+            return set(cached)
+        packages = {
+            self._canonicalize_package_name(match.group(1))
+            for match in REQUIREMENTS_LINE_PATTERN.finditer(content)
+        }
+        packages.discard("")
+        with self._cache_lock:
+            self._requirements_cache[content] = frozenset(packages)
+            if len(self._requirements_cache) > REQUIREMENTS_CACHE_SIZE:
+                self._requirements_cache.popitem(last=False)
         return packages
 
     def _normalize_dependency_token(self, token: str) -> str:
         if not isinstance(token, str):
             return ""
-        cleaned = token.strip().strip("'\"")
-        if not cleaned or cleaned.startswith("-"):
-            return ""
-        cleaned = cleaned.split(";", 1)[0].strip()
-        cleaned = cleaned.split(" @", 1)[0].strip()
-        cleaned = cleaned.split("@", 1)[0].strip()
-        if "[" in cleaned:
-            cleaned = cleaned.split("[", 1)[0].strip()
-        cleaned = self._strip_version(cleaned)
-        cleaned = cleaned.replace("_", "-")
-        cleaned = cleaned.strip()
-        return self._canonicalize_package_name(cleaned)
+        name = _dependency_token_name(token)
+        return self._canonicalize_package_name(name) if name else ""
 
     def _canonicalize_package_name(self, name: str) -> str:
-        normalized = (name or "").strip().lower()
-        if not normalized or normalized == ".":
-            return ""
-        normalized = normalized.replace("_", "-")
-        alias_map = getattr(self, "_module_alias_map", PYTHON_MODULE_PACKAGE_MAP)
-        return alias_map.get(normalized, normalized)
+        return _canonicalize_name(name, self._alias_lookup)
 
     def _read_text_content(self, entry: Dict[str, Any]) -> str:
         content = entry.get("content")
         if not isinstance(content, str):
             return ""
-        encoding = (entry.get("encoding") or "plain").lower()
-        if encoding == "base64":
+        if _is_base64_entry(entry):
+            # The guard, dependency detectors, snippets and materialization each
+            # read the same entries; decode a given payload only once.
+            with self._cache_lock:
+                cached = self._decoded_cache.get(content)
+                if cached is not None:
+                    self._decoded_cache.move_to_end(content)
+                    return cached
             try:
-                decoded = base64.b64decode(content.encode("utf-8"))
-                return decoded.decode("utf-8", errors="ignore")
+                decoded = _b64decode(content).decode("utf-8", errors="ignore")
             except Exception as exc:  # pragma: no cover - guardrail logging
                 LOGGER.warning("Base64 decode failed for %s: %s", entry.get("path", "<unknown>"), exc)
                 return ""
+            with self._cache_lock:
+                self._decoded_cache[content] = decoded
+                if len(self._decoded_cache) > DECODED_CACHE_SIZE:
+                    self._decoded_cache.popitem(last=False)
+            return decoded
         return content
 
-    def _path_in_allowlist(self, path: str, patterns: Sequence[str]) -> bool:
-        return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
-
     def _normalize_requirements_path(self, path: str) -> str:
         normalized = (path or "").strip().lstrip("./")
         return normalized.replace("\\", "/")
 
-    def _is_python_path(self, path: str) -> bool:
-        return path.lower().endswith(".py")
-
     def _find_file_entry(self, manifest: Dict[str, Any], filename: str) -> Dict[str, Any] | None:
         target = filename.strip()
         for entry in manifest.get("files", []):
@@ -1512,22 +1816,12 @@ class SynthesisEngine:
                 return entry
         return None
 
-    @staticmethod
-    def _strip_version(token: str) -> str:
-        separators = ["==", ">=", "<=", "~=", ">", "<"]
-        for sep in separators:
-            if sep in token:
-                return token.split(sep, 1)[0].strip()
-        return token.strip()
-
-
     def _inject_user_deps(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
         if not self._user_deps:
             return manifest
         deps = [dep for dep in (manifest.get("deps") or []) if isinstance(dep, str) and dep.strip()]
         lower_seen = {dep.lower() for dep in deps}
-        for dep in self._user_deps:
-            key = dep.lower()
+        for dep, key in self._user_dep_keys:
             if key in lower_seen:
                 continue
             deps.append(dep)
@@ -1,9 +1,11 @@
 """Code templates for the MVP SQLi environment."""
 from __future__ import annotations
 
+import functools
 import textwrap
 
 
+@functools.lru_cache(maxsize=None)
 def render_app_py() -> str:
     return textwrap.dedent(
         """
@@ -63,6 +65,7 @@ def render_app_py() -> str:
     ).strip() + "\n"
 
 
+@functools.lru_cache(maxsize=None)
 def render_schema_sql() -> str:
     return textwrap.dedent(
         """
@@ -81,6 +84,7 @@ def render_schema_sql() -> str:
     ).strip() + "\n"
 
 
+@functools.lru_cache(maxsize=None)
 def render_dockerfile() -> str:
     return textwrap.dedent(
         """
@@ -100,6 +104,7 @@ def render_requirements() -> str:
     return "Flask==3.0.0\nrequests==2.31.0\n"
 
 
+@functools.lru_cache(maxsize=None)
 def render_poc_py() -> str:
     return textwrap.dedent(
         """
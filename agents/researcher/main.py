@@ -15,6 +15,7 @@ from common.logging import get_logger
 from common.paths import ensure_dir, get_metadata_dir
 from common.plan import load_plan
 from common.run_matrix import load_vuln_bundles
+from rag.tools import WebSearchTool
 
 LOGGER = get_logger(__name__)
 
@@ -32,17 +33,20 @@ def main() -> None:
     plan = load_plan(args.sid)
     bundles = load_vuln_bundles(plan)
     reports = []
-    for bundle in bundles:
-        service = ResearcherService(
-            args.sid,
-            mode=args.mode,
-            search_limit=args.search_limit,
-            plan=plan,
-            bundle=bundle,
-        )
-        path = service.run()
-        reports.append({"vuln_id": bundle.vuln_id, "slug": bundle.slug, "report_path": str(path)})
-        LOGGER.info("Researcher finished for %s (%s)", args.sid, bundle.vuln_id)
+    # Shared across bundles so remote search sessions are set up once.
+    with WebSearchTool() as search_tool:
+        for bundle in bundles:
+            service = ResearcherService(
+                args.sid,
+                mode=args.mode,
+                search_limit=args.search_limit,
+                plan=plan,
+                bundle=bundle,
+                search_tool=search_tool,
+            )
+            path = service.run()
+            reports.append({"vuln_id": bundle.vuln_id, "slug": bundle.slug, "report_path": str(path)})
+            LOGGER.info("Researcher finished for %s (%s)", args.sid, bundle.vuln_id)
     _write_index(args.sid, reports)
 
 
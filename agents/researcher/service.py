@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 import json
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
+import yaml
+
+from common import jsonio
 from common.llm import LLMClient
 from common.logging import get_logger
 from common.paths import ensure_dir, get_repo_root
@@ -36,6 +40,7 @@ class ResearcherService:
         *,
         plan: Optional[Dict[str, Any]] = None,
         bundle: Optional[VulnBundle] = None,
+        search_tool: Optional[WebSearchTool] = None,
     ) -> None:
         self.sid = sid
         self.plan = plan or load_plan(sid)
@@ -56,7 +61,10 @@ class ResearcherService:
         )
         self.llm = LLMClient(model, self.profile)
         self.react_loop = ReactLoop(sid)
-        self.search_tool = WebSearchTool()
+        # A tool passed in is shared (and closed) by the caller; one built here
+        # is closed by run() once searching is done.
+        self._owns_search_tool = search_tool is None
+        self.search_tool = search_tool or WebSearchTool()
         self.search_limit = max(1, search_limit)
 
     def run(self) -> Path:
@@ -64,7 +72,11 @@ class ResearcherService:
         rag_context = load_static_context(snapshot)
         queries = self.react_loop.queries_from_requirement(self.requirement)
         with self.react_loop.span(queries=queries) as span:
-            search_hits = self._collect_search_results(queries, span=span)
+            try:
+                search_hits = self._collect_search_results(queries, span=span)
+            finally:
+                if self._owns_search_tool:
+                    self.search_tool.close()
             report = self._generate_report(rag_context, search_hits)
             report.setdefault("sid", self.sid)
             report.setdefault("trace_id", self.react_loop.trace_id)
@@ -99,8 +111,9 @@ class ResearcherService:
     def _collect_search_results(self, queries: Iterable[str], span: ReactSpan) -> List[SearchResult]:
         hits: List[SearchResult] = []
         seen_urls: set[str] = set()
-        for query in queries:
-            new_hits = self.search_tool.search(query, limit=self.search_limit)
+        queries = list(queries)
+        results = self.search_tool.search_all(queries, limit=self.search_limit)
+        for query, new_hits in zip(queries, results):
             span.event("search", query=query, hits=len(new_hits))
             for hit in new_hits:
                 if hit.url in seen_urls:
@@ -123,11 +136,11 @@ class ResearcherService:
     def _parse_report(self, raw: str) -> Dict[str, Any]:
         text = (raw or "").strip()
         if text.startswith("```"):
-            segments = [segment.strip() for segment in text.split("```") if segment.strip()]
-            if segments:
-                candidate = segments[0]
-                if candidate.lower().startswith("json"):
-                    candidate = candidate[4:].strip()
+            # Only the first fenced block matters; partition stops at its closing fence.
+            candidate = text[3:].partition("```")[0].strip()
+            if candidate[:4].lower() == "json":
+                candidate = candidate[4:].strip()
+            if candidate:
                 text = candidate
         try:
             report = json.loads(text)
@@ -143,7 +156,7 @@ class ResearcherService:
 
     def _write_report(self, report: Dict[str, Any]) -> Path:
         path = self.metadata_dir / "researcher_report.json"
-        path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        path.write_bytes(jsonio.dumps_bytes(report, indent=True))
         return path
 
     def _synthesize_candidates(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -178,8 +191,6 @@ class ResearcherService:
         return output
 
     def _write_candidate_rule(self, bundle: VulnBundle, rule: Dict[str, Any]) -> Path:
-        import yaml
-
         filename = f"{bundle.vuln_id.lower()}.yaml"
         path = self.runtime_rules_dir / filename
         path.write_text(yaml.safe_dump(rule, sort_keys=False, allow_unicode=True), encoding="utf-8")
@@ -187,8 +198,6 @@ class ResearcherService:
         return path
 
     def _write_candidate_template(self, bundle: VulnBundle, base_template_dir: Path) -> Path | None:
-        import shutil
-
         repo_root = get_repo_root()
         source = repo_root / base_template_dir
         if not source.exists():
@@ -204,7 +213,7 @@ class ResearcherService:
             data = {"id": dest.name}
         data["id"] = f"{bundle.vuln_id.lower()}-candidate"
         data["name"] = f"{bundle.vuln_id} candidate template"
-        template_json.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        template_json.write_bytes(jsonio.dumps_bytes(data, indent=True))
         return dest
 
     def _load_template_metadata(self, template_root: Path) -> Dict[str, Any]:
@@ -0,0 +1,56 @@
+"""JSON (de)serialization helpers that prefer ``orjson`` when installed.
+
+Generator manifests embed full file contents, so parsing and dumping them
+dominates the synthesis bookkeeping. ``orjson`` is several times faster than
+the stdlib encoder; when it is unavailable (or a payload holds types it cannot
+encode) we fall back to :mod:`json` with equivalent output settings.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(raw: str | bytes) -> Any:
+    """Parse JSON text; raises :class:`JSONDecodeError` on invalid input."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_bytes(payload: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``payload`` to UTF-8 bytes without ASCII escaping (optionally 2-space indented)."""
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            pass
+    return json.dumps(payload, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_canonical(payload: Any) -> bytes:
+    """Return compact, key-sorted UTF-8 bytes suitable for hashing.
+
+    Separators are "," and ":" (no spaces), so hashes differ from ones taken
+    over ``json.dumps(payload, sort_keys=True)`` with its default separators.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+__all__ = ["JSONDecodeError", "dumps_bytes", "dumps_canonical", "loads"]
@@ -7,6 +7,7 @@ stub that keeps the rest of the pipeline runnable for dry-runs/tests.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import Any, Dict, List, Optional
@@ -18,6 +19,11 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - optional dependency
     litellm_completion = None
 
+try:  # pragma: no cover - optional dependency
+    from litellm import acompletion as litellm_acompletion
+except Exception:  # pragma: no cover - optional dependency
+    litellm_acompletion = None
+
 
 LOGGER = logging.getLogger("common.llm")
 
@@ -70,6 +76,31 @@ class LLMClient:
             return self._stub_response(messages)
 
         assert litellm_completion is not None  # for type-checkers
+        payload = self._build_payload(messages, tools)
+        LOGGER.debug("Invoking litellm with payload keys: %s", list(payload))
+        response = litellm_completion(**payload)  # pragma: no cover - network call
+        self._last_usage = getattr(response, "usage", None)
+        return response["choices"][0]["message"]["content"]
+
+    async def agenerate(
+        self, messages: List[Dict[str, str]], *, tools: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """Async variant of :meth:`generate` so several prompts can share one event loop."""
+
+        if self.use_stub:
+            return self._stub_response(messages)
+        if litellm_acompletion is None:  # pragma: no cover - litellm without async API
+            return await asyncio.to_thread(self.generate, messages, tools=tools)
+
+        payload = self._build_payload(messages, tools)
+        LOGGER.debug("Invoking async litellm with payload keys: %s", list(payload))
+        response = await litellm_acompletion(**payload)  # pragma: no cover - network call
+        self._last_usage = getattr(response, "usage", None)
+        return response["choices"][0]["message"]["content"]
+
+    def _build_payload(
+        self, messages: List[Dict[str, str]], tools: Optional[List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": self.model_name,
             "messages": messages,
@@ -77,11 +108,7 @@ class LLMClient:
         }
         if tools:
             payload["tools"] = tools
-
-        LOGGER.debug("Invoking litellm with payload keys: %s", list(payload))
-        response = litellm_completion(**payload)  # pragma: no cover - network call
-        self._last_usage = getattr(response, "usage", None)
-        return response["choices"][0]["message"]["content"]
+        return payload
 
     def _stub_response(self, messages: List[Dict[str, str]]) -> str:
         """Return a deterministic stub when the real model is unavailable."""
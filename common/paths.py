@@ -1,6 +1,7 @@
 """Path helpers to keep directory layout consistent."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -23,3 +24,19 @@ def get_artifacts_dir(sid: str) -> Path:
 def ensure_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file and rename it over ``path``.
+
+    Readers polling metadata never observe a half-written JSON document.
+    """
+
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open("wb") as handle:
+            handle.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -5,6 +5,7 @@ from .templates import (
     build_researcher_prompt,
     build_reviewer_prompt,
     build_synthesis_prompt,
+    build_synthesis_prompts,
     build_llm_verifier_prompt,
 )
 
@@ -12,6 +13,7 @@ __all__ = [
     "build_generator_prompt",
     "build_reviewer_prompt",
     "build_synthesis_prompt",
+    "build_synthesis_prompts",
     "build_researcher_prompt",
     "build_llm_verifier_prompt",
 ]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 DEFAULT_SUCCESS_SIGNATURES = {
     "cwe-89": "SQLi SUCCESS",
@@ -56,6 +56,62 @@ def build_synthesis_prompt(
 ) -> List[Dict[str, str]]:
     """Prompt that asks the LLM to emit a manifest for synthesis mode."""
 
+    system, body = _synthesis_prompt_parts(
+        requirement,
+        rag_context,
+        hints=hints,
+        failure_context=failure_context,
+        limits=limits,
+        poc_template=poc_template,
+    )
+    return _synthesis_messages(system, body, candidate_index)
+
+
+def build_synthesis_prompts(
+    requirement: Dict[str, object],
+    rag_context: str,
+    *,
+    candidate_count: int,
+    hints: str = "",
+    failure_context: str = "",
+    limits: Optional[Dict[str, object]] = None,
+    poc_template: Optional[Dict[str, object]] = None,
+) -> List[List[Dict[str, str]]]:
+    """Synthesis prompts for candidates 1..candidate_count.
+
+    Only the candidate number differs between candidates, so the requirement,
+    limits, RAG context and PoC template are rendered once and shared.
+    """
+
+    system, body = _synthesis_prompt_parts(
+        requirement,
+        rag_context,
+        hints=hints,
+        failure_context=failure_context,
+        limits=limits,
+        poc_template=poc_template,
+    )
+    return [_synthesis_messages(system, body, idx) for idx in range(1, candidate_count + 1)]
+
+
+def _synthesis_messages(system: str, body: str, candidate_index: int) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": f"Synthesize candidate #{candidate_index}{body}"},
+    ]
+
+
+def _synthesis_prompt_parts(
+    requirement: Dict[str, object],
+    rag_context: str,
+    *,
+    hints: str,
+    failure_context: str,
+    limits: Optional[Dict[str, object]],
+    poc_template: Optional[Dict[str, object]],
+) -> Tuple[str, str]:
+    """Return the system prompt and the user prompt minus its leading candidate number."""
+
     system = (
         "You synthesize intentionally vulnerable Docker bundles for education. "
         "Follow docs/handbook.md (아키텍처/스키마) and produce ONLY compact JSON "
@@ -65,12 +121,11 @@ def build_synthesis_prompt(
     limits_payload = json.dumps(limits or {}, indent=2, ensure_ascii=False)
     success_signature = _success_signature(requirement)
     sections = [
-        "Synthesize candidate #{idx} for the request below. The manifest must be JSON "
+        " for the request below. The manifest must be JSON "
         "and contain files[], deps[], build, run, poc, notes, pattern_tags[]. "
         "Respect the file/path limits verbatim, ensure the PoC prints the {sig} success signature (or the requirement-specific equivalent), and do not add standard library modules (e.g., logging, sqlite3) to deps[]."
         "\n\n# Requirement\n{req}\n\n# Synthesis Limits\n{limits}"
         "\n\n# Internal Hints\n{hints}\n\n# RAG Context\n{rag}".format(
-            idx=candidate_index,
             sig=success_signature,
             req=requirement_payload,
             limits=limits_payload,
@@ -83,11 +138,7 @@ def build_synthesis_prompt(
         sections.append(f"\n# PoC Template\n{poc_payload}")
     if failure_context:
         sections.append(f"\n# Failure Context\n{failure_context}")
-    user = "".join(sections)
-    return [
-        {"role": "system", "content": system},
-        {"role": "user", "content": user},
-    ]
+    return system, "".join(sections)
 
 
 def build_reviewer_prompt(run_summary: Dict[str, object]) -> List[Dict[str, str]]:
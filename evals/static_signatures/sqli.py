@@ -24,6 +24,9 @@ KEYWORDS = [
     "OR 1=1",
 ]
 
+_COMPILED_PATTERNS = {name: re.compile(pattern, re.IGNORECASE) for name, pattern in SQLI_PATTERNS.items()}
+_LOWERED_KEYWORDS = [(keyword, keyword.lower()) for keyword in KEYWORDS]
+
 
 def _collect_text(manifest: Dict[str, object]) -> List[str]:
     files = manifest.get("files") or []
@@ -51,13 +54,13 @@ def analyze_sql_injection_signals(manifest: Dict[str, object]) -> Dict[str, obje
 
     blobs = _collect_text(manifest)
     combined = "\n".join(blobs)
-    signals: Dict[str, bool] = {}
-    for name, pattern in SQLI_PATTERNS.items():
-        signals[name] = bool(re.search(pattern, combined, flags=re.IGNORECASE))
-    keywords_found: List[str] = []
-    for keyword in KEYWORDS:
-        if keyword.lower() in combined.lower():
-            keywords_found.append(keyword)
+    signals: Dict[str, bool] = {
+        name: pattern.search(combined) is not None for name, pattern in _COMPILED_PATTERNS.items()
+    }
+    # Lowercase the candidate text once; plain substring search beats a regex
+    # alternation for this handful of literal keywords.
+    lowered = combined.lower()
+    keywords_found = [keyword for keyword, needle in _LOWERED_KEYWORDS if needle in lowered]
     hit_count = sum(1 for hit in signals.values() if hit)
     score = hit_count / max(1, len(SQLI_PATTERNS))
     return {
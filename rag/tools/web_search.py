@@ -1,10 +1,13 @@
 """Fallback-friendly web search helper for the Researcher agent."""
 from __future__ import annotations
 
+import functools
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from common.logging import get_logger
 from common.paths import get_repo_root
@@ -15,6 +18,7 @@ except Exception:  # pragma: no cover - optional dependency
     requests = None
 
 LOGGER = get_logger(__name__)
+MAX_SEARCH_WORKERS = 8
 
 
 @dataclass
@@ -53,6 +57,47 @@ class WebSearchTool:
         self.timeout = timeout
         self.max_local_files = max_local_files
         self.local_root = get_repo_root() / "rag" / "corpus"
+        # requests.Session is not documented as thread-safe, so each worker
+        # thread keeps its own. Remote fan-out runs on one long-lived pool owned
+        # by the tool, so at most MAX_SEARCH_WORKERS sessions exist and their
+        # connections are reused by every search_all call until close().
+        self._local = threading.local()
+        self._sessions: List[Any] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "WebSearchTool":
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker pool and close every HTTP session it opened.
+
+        The tool stays usable; a later search starts a fresh pool.
+        """
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+
+    def search_all(self, queries: Sequence[str], limit: int = 3) -> List[List[SearchResult]]:
+        """Return the hits for each query, in query order.
+
+        Remote lookups are I/O bound and run concurrently on the tool's worker
+        pool; the local corpus fallback is CPU bound and stays serial.
+        """
+
+        if not self.endpoint:
+            return [self.search(query, limit) for query in queries]
+        search = functools.partial(self.search, limit=limit)
+        return list(self._worker_pool().map(search, queries))
 
     def search(self, query: str, limit: int = 3) -> List[SearchResult]:
         """Return up to ``limit`` results for a query."""
@@ -75,7 +120,7 @@ class WebSearchTool:
             LOGGER.warning("requests package unavailable; skipping remote search endpoint %s", self.endpoint)
             return []
         try:  # pragma: no cover - network calls are not exercised in tests
-            response = requests.get(
+            response = self._thread_session().get(
                 self.endpoint,
                 params={"q": query, "size": limit},
                 timeout=self.timeout,
@@ -87,6 +132,24 @@ class WebSearchTool:
             return []
         return self._parse_remote_payload(payload, limit)
 
+    def _worker_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=MAX_SEARCH_WORKERS, thread_name_prefix="web-search"
+                )
+            return self._executor
+
+    def _thread_session(self) -> Any:
+        local = self._local
+        session = getattr(local, "session", None)
+        if session is None:
+            session = requests.Session()
+            local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
     def _parse_remote_payload(self, payload: Any, limit: int) -> List[SearchResult]:
         candidates: List[Dict[str, Any]] = []
         if isinstance(payload, dict):
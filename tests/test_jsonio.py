@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from common import jsonio
+
+
+@pytest.mark.parametrize("backend", ["default", "stdlib"])
+def test_round_trip_matches_stdlib(backend: str) -> None:
+    payload = {"files": [{"path": "app.py", "content": "print('héllo')\n"}], "deps": [], "score": 0.5}
+    with patch.object(jsonio, "orjson", None if backend == "stdlib" else jsonio.orjson):
+        raw = jsonio.dumps_bytes(payload, indent=True)
+        assert jsonio.loads(raw) == payload
+        assert raw == json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+        with pytest.raises(jsonio.JSONDecodeError):
+            jsonio.loads("{not json")
+
+
+def test_canonical_bytes_are_key_order_independent() -> None:
+    left = jsonio.dumps_canonical({"b": 1, "a": [1, 2]})
+    right = jsonio.dumps_canonical({"a": [1, 2], "b": 1})
+    assert left == right == b'{"a":[1,2],"b":1}'
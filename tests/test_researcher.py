@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from agents.researcher.service import ResearcherService
+from rag.tools import SearchResult, WebSearchTool
+
+
+class _FakeSearchTool(WebSearchTool):
+    def __init__(self, endpoint: str | None) -> None:
+        super().__init__(endpoint=endpoint)
+        self.endpoint = endpoint
+        self.threads: set[int] = set()
+
+    def search(self, query: str, limit: int = 3) -> List[SearchResult]:
+        self.threads.add(threading.get_ident())
+        # Earlier queries answer last, so completion order differs from query order.
+        time.sleep({"first": 0.05, "second": 0.02}.get(query, 0))
+        return [
+            SearchResult(title=query, url=f"https://example.com/{query}", snippet="s"),
+            SearchResult(title=query, url="https://example.com/shared", snippet="s"),
+        ][:limit]
+
+
+class _Span:
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+
+    def event(self, name: str, **attrs: Any) -> None:
+        self.events.append((name, attrs))
+
+
+def _service(endpoint: str | None) -> ResearcherService:
+    service = object.__new__(ResearcherService)
+    service.search_tool = _FakeSearchTool(endpoint)
+    service.search_limit = 3
+    return service
+
+
+def test_collect_search_results_keeps_query_order_and_dedups() -> None:
+    for endpoint in (None, "https://search.invalid"):
+        service = _service(endpoint)
+        span = _Span()
+        hits = service._collect_search_results(iter(["first", "second", "third"]), span=span)
+        assert [hit.url for hit in hits] == [
+            "https://example.com/first",
+            "https://example.com/shared",
+            "https://example.com/second",
+            "https://example.com/third",
+        ]
+        assert [attrs["query"] for _, attrs in span.events] == ["first", "second", "third"]
+        assert all(attrs["hits"] == 2 for _, attrs in span.events)
+        # Only remote searches fan out over worker threads.
+        assert (len(service.search_tool.threads) > 1) == (endpoint is not None)
+        service.search_tool.close()
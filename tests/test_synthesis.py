@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from agents.generator import synthesis
+from agents.generator.synthesis import SynthesisEngine, SynthesisLimits
+
+
+def _engine(tmp_path: Path, requirement: Dict[str, Any] | None = None) -> SynthesisEngine:
+    engine = SynthesisEngine(
+        sid="sid-test",
+        llm=None,
+        limits=SynthesisLimits(),
+        workspace=tmp_path / "workspace" / "app",
+        metadata_dir=tmp_path / "metadata",
+        mode="deterministic",
+    )
+    engine._requirement = requirement or {"vuln_id": "CWE-999", "language": "python"}
+    engine._load_stdlib_spec()
+    return engine
+
+
+def _manifest(**overrides: Any) -> Dict[str, Any]:
+    manifest: Dict[str, Any] = {
+        "files": [
+            {"path": "requirements.txt", "content": "Flask==2.3.3\n"},
+            {"path": "app.py", "content": "from flask import Flask\n"},
+        ],
+        "deps": ["Flask==2.3.3"],
+        "pattern_tags": ["sqli"],
+        "poc": {"cmd": "python poc.py", "success_signature": "Exploit SUCCESS"},
+    }
+    manifest.update(overrides)
+    return manifest
+
+
+def test_guard_accepts_well_formed_manifest(tmp_path: Path) -> None:
+    violations, report = _engine(tmp_path)._guard_manifest(_manifest())
+    assert violations == []
+    assert report["declared"] == ["flask"]
+
+
+def test_guard_reports_shape_errors(tmp_path: Path) -> None:
+    manifest = _manifest(poc={"cmd": "python poc.py"}, deps=["ok", 3], pattern_tags=[])
+    violations, _ = _engine(tmp_path)._guard_manifest(manifest)
+    assert "poc section incomplete" in violations
+    assert "deps must be an array of strings" in violations
+    assert "pattern_tags required" in violations
+
+
+
+def test_guard_orders_poc_errors_before_section_errors(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, {"vuln_id": "CWE-89", "language": "python"})
+    engine._rule = {"flag_token": "FLAG-x", "strict_flag": True}
+    manifest = _manifest(poc={"cmd": "python poc.py", "success_signature": "nope"}, deps=[3], pattern_tags=[])
+    violations, _ = engine._guard_manifest(manifest)
+    assert violations == [
+        "success_signature must include 'SQLi SUCCESS'",
+        "flag token 'FLAG-x' missing from manifest",
+        "deps must be an array of strings",
+        "pattern_tags required",
+    ]
+    manifest["poc"] = {"cmd": "python poc.py"}
+    violations, _ = engine._guard_manifest(manifest)
+    assert violations[:3] == ["poc section incomplete", "deps must be an array of strings", "pattern_tags required"]
+
+def test_guard_byte_limit_counts_utf8_bytes(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    engine.limits = SynthesisLimits(max_bytes_per_file=10)
+    manifest = _manifest()
+    manifest["files"].append({"path": "README.md", "content": "é" * 6})
+    manifest["files"].append({"path": "schema.sql", "content": "x" * 10})
+    violations, _ = engine._guard_manifest(manifest)
+    assert "README.md exceeds byte limit (12)" in violations
+    assert not any(item.startswith("schema.sql") for item in violations)
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        ("Flask==2.0.3", "flask"),
+        ("'requests>=2'", "requests"),
+        ("uvicorn[standard] >= 0.20", "uvicorn"),
+        ("typing_extensions; python_version < '3.8'", "typing-extensions"),
+        ("pkg @ https://example.com/pkg.whl", "pkg"),
+        ("django!=4.0", "django"),
+        ("-r requirements.txt", ""),
+        ("git+https://github.com/org/repo", ""),
+        (".", ""),
+    ],
+)
+def test_normalize_dependency_token(tmp_path: Path, token: str, expected: str) -> None:
+    assert _engine(tmp_path)._normalize_dependency_token(token) == expected
+
+
+def test_parse_requirements_content_skips_comments_and_options(tmp_path: Path) -> None:
+    content = "# pinned\nFlask==2.0  # web\r\n  requests\n-r base.txt\n--hash=sha256:abc\nuvicorn[standard]>=0.20\n\nfoo_bar\n"
+    assert _engine(tmp_path)._parse_requirements_content(content) == {"flask", "requests", "uvicorn", "foo-bar"}
+
+
+def test_parse_requirements_content_cache_returns_copies(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    first = engine._parse_requirements_content("flask\n")
+    first.add("mutated")
+    assert engine._parse_requirements_content("flask\n") == {"flask"}
+
+
+def test_append_requirement_line_tracks_existing_packages(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    entry = {"path": "requirements.txt", "content": "Flask==2.3.3"}
+    existing = engine._extract_packages_from_requirements(entry["content"])
+    for package, version in (("requests", "2.31.0"), ("flask", "3.0.0"), ("Requests", "2.0"), ("PyYAML", "")):
+        engine._append_requirement_line(entry, package, version, existing)
+    assert entry["content"] == "Flask==2.3.3\nrequests==2.31.0\nPyYAML\n"
+    assert existing == {"flask", "requests", "pyyaml"}
+
+
+def test_extract_pyproject_dependencies_skips_python_constraint(tmp_path: Path) -> None:
+    data = {
+        "project": {"dependencies": ["Flask>=2"], "optional-dependencies": {"test": ["pytest"], "none": None}},
+        "tool": {"poetry": {"dependencies": {"Python": "^3.11", "Requests": "*"}, "extras": {"xml": ["lxml"]}}},
+    }
+    assert _engine(tmp_path)._extract_pyproject_dependencies(data) == {"flask", "pytest", "requests", "lxml"}
+
+
+def test_parse_manifest_accepts_fenced_json(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    assert engine._parse_manifest('```json\n{"intent": "x", "files": []}\n```', 1) == {"intent": "x", "files": []}
+    assert engine._parse_manifest(' {"intent": "y"} ', 1) == {"intent": "y"}
+    assert "fallback" in engine._parse_manifest("not json", 1)["intent"]
+
+
+def test_read_text_content_decodes_base64(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    encoded = base64.b64encode("print('héllo')\n".encode("utf-8")).decode("ascii")
+    assert engine._read_text_content({"content": encoded, "encoding": "base64"}) == "print('héllo')\n"
+    assert engine._read_text_content({"content": encoded[:20] + "\n" + encoded[20:], "encoding": "base64"}) == "print('héllo')\n"
+    assert engine._read_text_content({"content": "plain", "encoding": None}) == "plain"
+    assert engine._read_text_content({"content": encoded, "encoding": "BASE64"}) == "print('héllo')\n"
+
+
+def test_read_text_content_reuses_decoded_base64(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    encoded = base64.b64encode(b"flask\n").decode("ascii")
+    first = engine._read_text_content({"path": "requirements.txt", "content": encoded, "encoding": "base64"})
+    second = engine._read_text_content({"path": "other.txt", "content": encoded, "encoding": "base64"})
+    assert first == "flask\n" and second is first
+
+
+def test_limits_allowlist_matches_literals_and_globs() -> None:
+    limits = SynthesisLimits(allowlist=("Dockerfile", "*.py", "requirements*.txt", "conf/[ab].ini"))
+    assert limits.allows("Dockerfile")
+    assert limits.allows("pkg/module.py")
+    assert limits.allows("requirements-dev.txt")
+    assert limits.allows("conf/a.ini")
+    assert not limits.allows("dockerfile.bak")
+    assert not limits.allows("conf/c.ini")
+    assert not SynthesisLimits(allowlist=()).allows("app.py")
+
+
+def test_materialize_keeps_unchanged_files_and_prunes_stale(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    workspace = engine.workspace
+    stale = workspace / "old" / "leftover.txt"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("stale", encoding="utf-8")
+    manifest = _manifest()
+    engine._materialize(manifest)
+    app_path = workspace / "app.py"
+    first_mtime = app_path.stat().st_mtime_ns
+    assert not stale.exists() and not stale.parent.exists()
+
+    manifest["files"][0]["content"] = "Flask==3.0.0\n"
+    written = engine._materialize(manifest)
+    assert written == ["requirements.txt", "app.py"]
+    assert app_path.stat().st_mtime_ns == first_mtime
+    assert (workspace / "requirements.txt").read_text(encoding="utf-8") == "Flask==3.0.0\n"
+
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        ("lib", "lib/mod.py"),
+        ("lib/mod.py", "lib"),
+    ],
+)
+def test_materialize_swaps_files_and_directories(tmp_path: Path, first: str, second: str) -> None:
+    engine = _engine(tmp_path)
+    engine._materialize({"files": [{"path": first, "content": "one\n"}]})
+    assert engine._materialize({"files": [{"path": second, "content": "two\n"}]}) == [second]
+    target = engine.workspace / second
+    assert target.is_file() and target.read_text(encoding="utf-8") == "two\n"
+    assert sorted(path.name for path in engine.workspace.rglob("*")) == sorted(Path(second).parts)
+
+
+def test_materialize_replaces_symlinks_instead_of_writing_through(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "app.py").write_text("keep", encoding="utf-8")
+    engine.workspace.mkdir(parents=True)
+    (engine.workspace / "app.py").symlink_to(outside / "app.py")
+    (engine.workspace / "pkg").symlink_to(outside, target_is_directory=True)
+    engine._materialize({"files": [{"path": "app.py", "content": "new"}, {"path": "pkg/app.py", "content": "new"}]})
+    assert (outside / "app.py").read_text(encoding="utf-8") == "keep"
+    for rel in ("app.py", "pkg/app.py"):
+        written = engine.workspace / rel
+        assert not written.is_symlink() and written.read_text(encoding="utf-8") == "new"
+    assert not (engine.workspace / "pkg").is_symlink()
+
+class _AsyncLLM:
+    def __init__(self) -> None:
+        self.async_calls = 0
+        self.sync_calls = 0
+
+    def generate(self, messages: Any) -> str:
+        self.sync_calls += 1
+        return messages[0]["content"]
+
+    async def agenerate(self, messages: Any) -> str:
+        self.async_calls += 1
+        await asyncio.sleep(0.01 if messages[0]["content"] == "first" else 0)
+        return messages[0]["content"]
+
+
+def test_generate_candidates_prefers_async_client(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    engine.llm = _AsyncLLM()
+    prompts = [[{"role": "user", "content": text}] for text in ("first", "second", "third")]
+    assert engine._generate_candidates(prompts) == ["first", "second", "third"]
+    assert (engine.llm.async_calls, engine.llm.sync_calls) == (3, 0)
+
+    async def inside_loop() -> Any:
+        return engine._generate_candidates(prompts)
+
+    assert asyncio.run(inside_loop()) == ["first", "second", "third"]
+    assert engine.llm.sync_calls == 3
+
+
+def test_parse_pip_install_body_handles_flags(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    requirements_by_path = {"requirements.txt": {"flask"}, "dev.txt": {"pytest"}}
+    body = " --no-cache-dir -r 'requirements.txt' --requirement=dev.txt -e ./pkg \"requests>=2\" gunicorn ."
+    assert engine._parse_pip_install_body(body, requirements_by_path) == {"flask", "pytest", "requests", "gunicorn"}
+
+
+def test_manifest_requires_external_db_matches_canonical_deps(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    engine._rule = None
+    assert engine._manifest_requires_external_db(_manifest(deps=["PyMySQL==1.1.0"]))
+    assert engine._manifest_requires_external_db(_manifest(deps=["psycopg2>=2.9"]))
+    assert not engine._manifest_requires_external_db(_manifest())
+    files = [{"path": "app.py", "content": "import mysql.connector\n"}]
+    assert engine._manifest_requires_external_db(_manifest(deps=[], files=files))
+
+
+def test_generate_candidates_caps_concurrency(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(synthesis, "MAX_CANDIDATE_WORKERS", 2)
+
+    class _CountingLLM:
+        def __init__(self) -> None:
+            self.lock = threading.Lock()
+            self.active = 0
+            self.peak = 0
+
+        def _enter(self) -> None:
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+
+        def _leave(self) -> None:
+            with self.lock:
+                self.active -= 1
+
+        def generate(self, messages: Any) -> str:
+            self._enter()
+            time.sleep(0.01)
+            self._leave()
+            return messages[0]["content"]
+
+        async def agenerate(self, messages: Any) -> str:
+            self._enter()
+            await asyncio.sleep(0.01)
+            self._leave()
+            return messages[0]["content"]
+
+    engine = _engine(tmp_path)
+    prompts = [[{"role": "user", "content": str(idx)}] for idx in range(6)]
+    engine.llm = _CountingLLM()
+    assert engine._generate_candidates(prompts) == [str(idx) for idx in range(6)]
+    assert engine.llm.peak == 2
+
+    async def inside_loop() -> Any:
+        return engine._generate_candidates(prompts)
+
+    engine.llm = _CountingLLM()
+    assert asyncio.run(inside_loop()) == [str(idx) for idx in range(6)]
+    assert engine.llm.peak == 2
+
+
+def test_evaluate_candidates_caps_concurrency(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(synthesis, "MAX_CANDIDATE_WORKERS", 2)
+    engine = _engine(tmp_path)
+    lock = threading.Lock()
+    counts = {"active": 0, "peak": 0}
+
+    def evaluate(idx: int, raw: str, poc_template: Any) -> Any:
+        with lock:
+            counts["active"] += 1
+            counts["peak"] = max(counts["peak"], counts["active"])
+        time.sleep(0.01)
+        with lock:
+            counts["active"] -= 1
+        return (idx, raw)
+
+    monkeypatch.setattr(engine, "_uses_llm_dep_inference", lambda: True)
+    monkeypatch.setattr(engine, "_evaluate_candidate", evaluate)
+    raws = [f"raw-{idx}" for idx in range(6)]
+    assert engine._evaluate_candidates(raws, {}) == list(enumerate(raws, start=1))
+    assert counts["peak"] == 2
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from rag.tools import web_search
+from rag.tools.web_search import WebSearchTool
+
+
+class _FakeResponse:
+    def __init__(self, query: str) -> None:
+        self.query = query
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Any:
+        return {"results": [{"title": self.query, "url": f"https://example.com/{self.query}", "snippet": "s"}]}
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.closed = False
+        self.threads: set[int] = set()
+
+    def get(self, url: str, *, params: Any, timeout: float) -> _FakeResponse:
+        self.threads.add(threading.get_ident())
+        return _FakeResponse(params["q"])
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_remote_search_uses_one_session_per_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: List[_FakeSession] = []
+
+    def make_session() -> _FakeSession:
+        created.append(_FakeSession())
+        return created[-1]
+
+    monkeypatch.setattr(web_search, "requests", SimpleNamespace(Session=make_session))
+    with WebSearchTool(endpoint="https://search.invalid") as tool:
+        assert [hit.title for hit in tool.search("main")] == ["main"]
+        tool.search("again")
+        worker = threading.Thread(target=tool.search, args=("worker",))
+        worker.start()
+        worker.join()
+        assert len(created) == 2
+        assert all(len(session.threads) == 1 for session in created)
+    assert all(session.closed for session in created)
+
+
+def test_search_all_reuses_pooled_sessions_across_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: List[_FakeSession] = []
+
+    def make_session() -> _FakeSession:
+        created.append(_FakeSession())
+        return created[-1]
+
+    monkeypatch.setattr(web_search, "requests", SimpleNamespace(Session=make_session))
+    tool = WebSearchTool(endpoint="https://search.invalid")
+    queries = [f"q{idx}" for idx in range(6)]
+    for _ in range(5):  # one call per researcher bundle
+        results = tool.search_all(queries, limit=1)
+        assert [[hit.title for hit in hits] for hits in results] == [[query] for query in queries]
+    assert 1 <= len(created) <= web_search.MAX_SEARCH_WORKERS
+    assert len(tool._sessions) == len(created)
+    tool.close()
+    assert tool._executor is None and tool._sessions == []
+    assert all(session.closed for session in created)